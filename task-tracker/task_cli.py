@@ -1,14 +1,106 @@
-import argparse
 import json
 import os
-from datetime import datetime
-from typing import Dict, List, Optional
+import stat
+import sys
+import time
+from contextlib import contextmanager
+from itertools import chain
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+FILENAME = "tasks.jsonl"
+DATE_FORMAT = "%d-%m-%Y %H:%M"
+_STATUSES = {status: sys.intern(status) for status in ("todo", "in-progress", "done")}
 
-from regex import D
-from tabulate import tabulate  # type: ignore
+_tasks_cache: Optional[List[Dict]] = None
+_cache_filename: Optional[str] = None
+_cache_stamp: Optional[Tuple[int, int, int]] = None
+_cache_index: Optional[Dict[int, int]] = None
+_cache_status_index: Optional[Dict[str, List[int]]] = None
 
-FILENAME = "tasks.json"
-DATE_FORMAT = "%d-%m-%Y %H:%M"
+_batch_depth = 0
+_batch_dirty: Optional[str] = None
+_durable = False
+
+_date_cache_minute: Optional[int] = None
+_date_cache_value: str = ""
+
+_LIST_COLUMNS = (
+    ("id", "ID"),
+    ("description", "Description"),
+    ("status", "Status"),
+    ("createdAt", "Created At"),
+    ("updatedAt", "Updated At"),
+)
+_LIST_HEADERS = [header for _, header in _LIST_COLUMNS]
+_task_row = itemgetter(*(field for field, _ in _LIST_COLUMNS))
+
+
+def _loads(data: bytes) -> object:
+    """Parses JSON bytes, using orjson when it is available."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: object) -> bytes:
+    """Serializes an object to a single line of JSON bytes, using orjson when it is available."""
+
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _file_stamp(filename: str) -> Tuple[int, int, int]:
+    """
+    Returns the modification time, size and inode of the given file, which together identify its current contents.
+
+    Every writer in this module either replaces the file (new inode) or appends to it (new size), so the stamp
+    changes on each write even on filesystems whose timestamps are too coarse to tell two writes apart.
+    """
+
+    file_stat = os.stat(filename)
+    return (file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino)
+
+
+def _index_by_id(tasks: List[Dict]) -> Dict[int, int]:
+    """
+    Maps each task ID to the position of the first task with that ID in the given task list.
+
+    The index is cached alongside the tasks cached by read_tasks and is only rebuilt after the task file changes,
+    so tasks must be the list that was just returned by read_tasks.
+    """
+
+    global _cache_index
+
+    if _cache_index is None:
+        _cache_index = {}
+        for i, task in enumerate(tasks):
+            _cache_index.setdefault(task["id"], i)
+    return _cache_index
+
+
+def _index_by_status(tasks: List[Dict]) -> Dict[str, List[int]]:
+    """
+    Maps each status to the positions of the tasks that have it in the given task list.
+
+    Like _index_by_id, the index is cached alongside the tasks cached by read_tasks,
+    so tasks must be the list that was just returned by read_tasks.
+    """
+
+    global _cache_status_index
+
+    if _cache_status_index is None:
+        _cache_status_index = {}
+        for i, task in enumerate(tasks):
+            _cache_status_index.setdefault(task.get("status"), []).append(i)
+    return _cache_status_index
 
 
 def get_current_date() -> str:
@@ -18,6 +110,7 @@ def get_current_date() -> str:
 
     This function uses the current date and time to generate a string representation
     formatted according to the specified DATE_FORMAT. It is useful for timestamping tasks or events.
+    Since DATE_FORMAT has minute resolution, the formatted string is cached and only rebuilt once the minute changes.
 
     Args:
         None
@@ -26,36 +119,74 @@ def get_current_date() -> str:
         str: The current date as a formatted string.
     """
 
-    return datetime.now().strftime(DATE_FORMAT)
+    global _date_cache_minute, _date_cache_value
+
+    minute = int(time.time() // 60)
+    if minute != _date_cache_minute:
+        _date_cache_value = time.strftime(DATE_FORMAT, time.localtime(minute * 60))
+        _date_cache_minute = minute
+    return _date_cache_value
 
 
 def initialize_task_file(filename: str = FILENAME) -> None:
     """
     Initializes the task file by creating it if it does not already exist.
-    The task file is created as an empty JSON array, and the filename can be specified.
+    The task file is created empty, and the filename can be specified.
 
-    This function checks for the existence of the specified filename.
-    If the file does not exist, it creates the file and initializes it with an empty JSON array.
+    This function tries to create the specified filename exclusively, which checks for its existence and creates it
+    in a single step. If the file does not exist, it is created empty, which represents a task list with no tasks.
+    If a task file in the previous JSON array format exists next to it (e.g. tasks.json for tasks.jsonl),
+    its tasks are imported into the new file; the old file is left untouched. An empty legacy file imports no tasks.
 
     Args:
         filename (str): The name of the file to initialize. Defaults to FILENAME.
 
     Returns:
         None
+
+    Raises:
+        ValueError: If the legacy task file is corrupted or contains invalid JSON. The new file is not created.
     """
 
-    if not os.path.exists(filename):
-        with open(filename, "w") as file:
-            json.dump([], file)
+    try:
+        file = open(filename, "xb")
+    except FileExistsError:
+        return
+
+    with file:
+        legacy_filename = os.path.splitext(filename)[0] + ".json"
+        if legacy_filename == filename:
+            return
+        try:
+            with open(legacy_filename, "rb") as legacy_file:
+                data = legacy_file.read()
+        except FileNotFoundError:
+            return
+        try:
+            tasks = _loads(data) if data.strip() else []
+        except json.JSONDecodeError:
+            tasks = None
+        if not isinstance(tasks, list) or not all(isinstance(task, dict) for task in tasks):
+            file.close()
+            os.remove(filename)
+            raise ValueError(
+                f"Could not import tasks from '{legacy_filename}', it is corrupted or contains invalid JSON."
+            )
+        if not tasks:
+            return
+        file.write(b"".join(_dumps(task) + b"\n" for task in tasks))
+    noun = "task" if len(tasks) == 1 else "tasks"
+    print(f"Imported {len(tasks)} {noun} from '{legacy_filename}' into '{filename}'.")
 
 
 def read_tasks(filename: str = FILENAME) -> List[Dict]:
     """
     Reads and returns the list of tasks from the specified task file.
-    The tasks are expected to be in JSON format and returned as a list of dictionaries.
+    The tasks are expected to be stored one JSON object per line and returned as a list of dictionaries.
 
     This function checks for the existence of the specified filename and raises an error if the file is not found.
-    It attempts to load the contents of the file, ensuring that the data is a valid list.
+    If the file has not been modified since it was last read or written in this process, or a tasks_batch block holds
+    unsaved changes to it, the cached tasks are returned without reopening the file. Otherwise it loads every line of the file, ensuring that each one is a valid task object.
     If the file is corrupted or contains invalid JSON, appropriate exceptions are raised.
 
     Args:
@@ -66,18 +197,43 @@ def read_tasks(filename: str = FILENAME) -> List[Dict]:
 
     Raises:
         FileNotFoundError: If the task file does not exist.
-        ValueError: If the file content is not a valid list or contains invalid JSON.
+        ValueError: If a line of the file is not a valid task object or contains invalid JSON.
     """
 
-    if not os.path.exists(filename):
-        raise FileNotFoundError(f"Task file '{filename}' not found.")
+    global _tasks_cache, _cache_filename, _cache_stamp, _cache_index, _cache_status_index
 
-    with open(filename, "r") as file:
+    if _batch_dirty is not None:
+        if _batch_dirty == filename:
+            return list(_tasks_cache)
+        _flush_batch()
+
+    try:
+        stamp = _file_stamp(filename)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Task file '{filename}' not found.") from None
+
+    if (
+        _tasks_cache is not None
+        and _cache_filename == filename
+        and _cache_stamp == stamp
+    ):
+        return list(_tasks_cache)
+
+    with open(filename, "rb") as file:
         try:
-            tasks = json.load(file)
-            if not isinstance(tasks, list):
+            tasks = [_loads(line) for line in file if line.strip()]
+            if not all(isinstance(task, dict) for task in tasks):
                 raise ValueError("Tasks file is corrupted or in an ivalid format.")
-            return tasks
+            for task in tasks:
+                status = task.get("status")
+                if isinstance(status, str):
+                    task["status"] = sys.intern(status)
+            _tasks_cache = tasks
+            _cache_filename = filename
+            _cache_stamp = stamp
+            _cache_index = None
+            _cache_status_index = None
+            return list(tasks)
         except json.JSONDecodeError as e:
             raise ValueError(
                 f"Tasks file '{filename}' is corrupted or contains invalid JSON."
@@ -86,11 +242,15 @@ def read_tasks(filename: str = FILENAME) -> List[Dict]:
 
 def write_tasks(tasks: List[Dict], filename: str = FILENAME) -> None:
     """
-    Writes the provided list of tasks to the specified task file in JSON format.
-    The tasks are saved with indentation for improved readability.
+    Writes the provided list of tasks to the specified task file, one JSON object per line.
+    This compacts the file, so it is used by operations that modify or remove existing tasks.
 
-    This function opens the specified filename in write mode and serializes the given list of tasks into JSON format.
-    It overwrites any existing content in the file with the new task data.
+    This function serializes each task in the given list into JSON format in memory, writes the result to a temporary
+    file with a single write and then renames it over the specified filename, so the task file is replaced atomically
+    and is never left half-written, keeping the file's permissions. The file and its directory are only fsynced
+    when durable writes were requested with --durable.
+    The in-memory cache used by read_tasks is kept in sync with what was written. Inside a tasks_batch block,
+    only the cache is updated and the file is written once when the block exits.
 
     Args:
         tasks (List[Dict]): A list of tasks to be written to the task file.
@@ -100,8 +260,278 @@ def write_tasks(tasks: List[Dict], filename: str = FILENAME) -> None:
         None
     """
 
-    with open(filename, "w") as file:
-        json.dump(tasks, file, indent=4)
+    global _tasks_cache, _cache_filename, _cache_stamp, _cache_index, _cache_status_index, _batch_dirty
+
+    if _batch_dirty is not None and _batch_dirty != filename:
+        _flush_batch()
+
+    _tasks_cache = list(tasks)
+    _cache_filename = filename
+    _cache_stamp = None
+    _cache_index = None
+    _cache_status_index = None
+    if _batch_depth:
+        _batch_dirty = filename
+        return
+
+    _save_cache()
+
+
+def _save_cache() -> None:
+    """
+    Atomically writes the cached tasks to the cached task file and records the file's new stamp.
+
+    The temporary file takes over the permissions of the task file and is removed if the write fails.
+    With --durable, both the file and its directory are fsynced, so the rename itself survives a crash.
+    """
+
+    global _cache_stamp, _batch_dirty
+
+    data = b"".join(_dumps(task) + b"\n" for task in _tasks_cache)
+    tmp_filename = f"{_cache_filename}.tmp"
+    try:
+        with open(tmp_filename, "wb") as file:
+            file.write(data)
+            if _durable:
+                file.flush()
+                os.fsync(file.fileno())
+        try:
+            os.chmod(tmp_filename, stat.S_IMODE(os.stat(_cache_filename).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_filename, _cache_filename)
+    except BaseException:
+        try:
+            os.remove(tmp_filename)
+        except FileNotFoundError:
+            pass
+        raise
+    if _durable:
+        dir_fd = os.open(os.path.dirname(_cache_filename) or ".", os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    _cache_stamp = _file_stamp(_cache_filename)
+    _batch_dirty = None
+
+
+def _flush_batch() -> None:
+    """Writes out the changes held back by a tasks_batch block, if there are any."""
+
+    if _batch_dirty is not None:
+        _save_cache()
+
+
+@contextmanager
+def tasks_batch() -> Iterator[None]:
+    """
+    Groups several task operations so the task file is written only once.
+
+    Inside the block, write_tasks and append_task only update the in-memory cache, and read_tasks returns it,
+    so a script that adds or changes many tasks pays for a single rewrite of the file when the block exits.
+    Blocks can be nested; the file is written when the outermost one exits, even if it exits with an exception.
+
+    Examples:
+        with tasks_batch():
+            add_task("Buy milk")
+            add_task("Walk dog")
+    """
+
+    global _batch_depth
+
+    _batch_depth += 1
+    try:
+        yield
+    finally:
+        _batch_depth -= 1
+        if not _batch_depth:
+            _flush_batch()
+
+
+def append_task(task: Dict, filename: str = FILENAME) -> None:
+    """
+    Appends a single task to the end of the specified task file.
+    Only the new task is serialized and written, regardless of how many tasks the file already holds.
+
+    This function is a shorthand for calling append_tasks with a one-element list.
+
+    Args:
+        task (Dict): The task to be appended to the task file.
+        filename (str): The name of the file to append the task to. Defaults to FILENAME.
+
+    Returns:
+        None
+    """
+
+    append_tasks([task], filename)
+
+
+def append_tasks(new_tasks: List[Dict], filename: str = FILENAME) -> None:
+    """
+    Appends the provided tasks to the end of the specified task file.
+    Only the new tasks are serialized and written, regardless of how many tasks the file already holds.
+
+    This function opens the specified filename in append mode and writes each task as one JSON line with a single write.
+    If the file does not end with a newline, for example after a hand edit, one is written first so that the last
+    existing task and the first new task do not end up on the same line.
+    If the in-memory cache used by read_tasks was up to date before the append, the tasks are added to it as well;
+    otherwise the cache is discarded so the next read reloads the file. Inside a tasks_batch block, the tasks are
+    only added to the cache and saved with the rest of the batch.
+
+    Args:
+        new_tasks (List[Dict]): The tasks to be appended to the task file.
+        filename (str): The name of the file to append the tasks to. Defaults to FILENAME.
+
+    Returns:
+        None
+    """
+
+    global _tasks_cache, _cache_stamp, _cache_index, _cache_status_index
+
+    if _batch_depth:
+        tasks = read_tasks(filename)
+        tasks.extend(new_tasks)
+        write_tasks(tasks, filename)
+        return
+
+    cache_is_fresh = (
+        _tasks_cache is not None
+        and _cache_filename == filename
+        and _cache_stamp == _file_stamp(filename)
+    )
+    data = b"".join(_dumps(task) + b"\n" for task in new_tasks)
+    with open(filename, "a+b") as file:
+        if file.seek(0, os.SEEK_END):
+            file.seek(-1, os.SEEK_END)
+            if file.read(1) != b"\n":
+                data = b"\n" + data
+        file.write(data)
+        if _durable:
+            file.flush()
+            os.fsync(file.fileno())
+    if cache_is_fresh:
+        for task in new_tasks:
+            if _cache_index is not None:
+                _cache_index.setdefault(task["id"], len(_tasks_cache))
+            if _cache_status_index is not None:
+                _cache_status_index.setdefault(task["status"], []).append(len(_tasks_cache))
+            _tasks_cache.append(task)
+        _cache_stamp = _file_stamp(filename)
+    else:
+        _tasks_cache = None
+        _cache_index = None
+        _cache_status_index = None
+
+
+def _next_id_filename(filename: str) -> str:
+    """Returns the name of the hidden file holding the next task ID for the given task file (e.g. ".tasks.jsonl.next_id")."""
+
+    directory, basename = os.path.split(filename)
+    return os.path.join(directory, f".{basename}.next_id")
+
+
+def read_next_id(filename: str = FILENAME) -> int:
+    """
+    Reads the ID to assign to the next task added to the specified task file.
+    The ID is kept in a small counter file next to the task file, so it can be read without loading any tasks.
+
+    Args:
+        filename (str): The name of the task file the counter belongs to. Defaults to FILENAME.
+
+    Returns:
+        int: The ID for the next task.
+
+    Raises:
+        FileNotFoundError: If the counter file does not exist.
+        ValueError: If the counter file does not contain a valid integer.
+    """
+
+    with open(_next_id_filename(filename), "rb") as file:
+        return int(file.read())
+
+
+def write_next_id(next_id: int, filename: str = FILENAME) -> None:
+    """
+    Stores the ID to assign to the next task added to the specified task file.
+
+    Args:
+        next_id (int): The ID for the next task.
+        filename (str): The name of the task file the counter belongs to. Defaults to FILENAME.
+
+    Returns:
+        None
+    """
+
+    with open(_next_id_filename(filename), "wb") as file:
+        file.write(b"%d" % next_id)
+
+
+def _last_task_id(filename: str) -> Optional[int]:
+    """
+    Returns the ID of the last task in the specified task file by reading only the end of the file.
+
+    Returns 0 for an empty file, and None when the last line cannot be parsed from the end of the file,
+    in which case the caller has to read the whole file instead.
+
+    Raises:
+        FileNotFoundError: If the task file does not exist.
+    """
+
+    with open(filename, "rb") as file:
+        size = file.seek(0, os.SEEK_END)
+        file.seek(max(0, size - 4096))
+        lines = file.read().splitlines()
+
+    for line in reversed(lines):
+        if not line.strip():
+            continue
+        try:
+            task = _loads(line)
+        except json.JSONDecodeError:
+            return None
+        if isinstance(task, dict) and isinstance(task.get("id"), int):
+            return task["id"]
+        return None
+    return 0 if size <= 4096 else None
+
+
+def _next_task_id(filename: str) -> int:
+    """
+    Returns the ID for the next task added to the specified task file, without advancing the counter.
+
+    The ID comes from the counter file kept next to the task file, so the existing tasks do not need to be read.
+    It is also kept above the ID of the last task in the file, or above the highest existing ID when there is no
+    usable counter yet or the tasks are already loaded in the cache. This protects against a stale counter after
+    the task file was restored or edited by hand.
+    If the task file is not found, a new task file is created.
+
+    Raises:
+        FileNotFoundError: If the task file could not be created.
+        ValueError: If the task file is corrupted or contains invalid JSON.
+    """
+
+    try:
+        next_id = read_next_id(filename)
+    except (FileNotFoundError, ValueError):
+        next_id = 0
+
+    tasks_are_cached = _tasks_cache is not None and _cache_filename == filename
+    if next_id and not tasks_are_cached:
+        try:
+            last_id = _last_task_id(filename)
+        except FileNotFoundError:
+            last_id = None
+        if last_id is not None:
+            return max(next_id, last_id + 1)
+
+    try:
+        tasks = read_tasks(filename)
+    except FileNotFoundError:
+        print(f"Task file '{filename}' not found. Initializing a new task file.")
+        initialize_task_file(filename)
+        tasks = read_tasks(filename)
+    return max(next_id, max((task["id"] for task in tasks), default=0) + 1)
 
 
 def add_task(description: str, filename: str = FILENAME) -> None:
@@ -109,9 +539,12 @@ def add_task(description: str, filename: str = FILENAME) -> None:
     Adds a new task with the specified description to the task list.
     If the task file does not exist, it initializes a new task file before adding the task.
 
-    This function attempts to read the current list of tasks from the specified file.
-    If the file is not found, it creates a new task file. A new task is then created with a unique ID,
-    default status, and timestamps, and is appended to the task list. Finally, the updated task list is saved back to the file.
+    This function takes the new task's ID from the counter file kept next to the task file, so the existing tasks
+    do not need to be read. If there is no usable counter yet, it reads the current list of tasks instead and uses
+    one greater than the highest existing ID; if the task file is not found, it creates a new task file.
+    The new task, with default status and timestamps, is appended to the end of the file, and only then is the
+    counter advanced. If the task file cannot be read, an appropriate message is displayed.
+    To add many tasks at once, use add_many instead.
 
     Args:
         description (str): A brief description of the task to be added.
@@ -122,24 +555,73 @@ def add_task(description: str, filename: str = FILENAME) -> None:
     """
 
     try:
-        tasks = read_tasks(filename)
-    except FileNotFoundError:
-        print(f"Task file '{filename}' not found. Initializing a new task file.")
-        initialize_task_file(filename)
-        tasks = []
+        task_id = _next_task_id(filename)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error reading tasks: {e}")
+        return
 
+    now = get_current_date()
     task = {
-        "id": len(tasks) + 1,
+        "id": task_id,
         "description": description,
-        "status": "todo",
-        "createdAt": get_current_date(),
-        "updatedAt": get_current_date(),
+        "status": _STATUSES["todo"],
+        "createdAt": now,
+        "updatedAt": now,
     }
-    tasks.append(task)
-    write_tasks(tasks, filename)
+    append_task(task, filename)
+    write_next_id(task_id + 1, filename)
     print(f"Task added successfully (ID: {task['id']})")
 
 
+def add_many(descriptions: List[str], filename: str = FILENAME) -> None:
+    """
+    Adds a new task for each of the specified descriptions to the task list.
+    If the task file does not exist, it initializes a new task file before adding the tasks.
+
+    This function works like add_task, but advances the counter file once for all of the new IDs,
+    timestamps every task with the same date, and appends all of the new tasks to the file with a single write.
+
+    Args:
+        descriptions (List[str]): The descriptions of the tasks to be added, in order.
+        filename (str): The name of the file to write tasks to. Defaults to FILENAME.
+
+    Returns:
+        None
+    """
+
+    if not descriptions:
+        print("No tasks to add.")
+        return
+
+    try:
+        first_id = _next_task_id(filename)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error reading tasks: {e}")
+        return
+
+    now = get_current_date()
+    todo = _STATUSES["todo"]
+    new_tasks = [
+        {
+            "id": first_id + i,
+            "description": description,
+            "status": todo,
+            "createdAt": now,
+            "updatedAt": now,
+        }
+        for i, description in enumerate(descriptions)
+    ]
+    append_tasks(new_tasks, filename)
+    write_next_id(first_id + len(new_tasks), filename)
+    if len(new_tasks) == 1:
+        print(f"Task added successfully (ID: {first_id})")
+    else:
+        print(
+            f"{len(new_tasks)} tasks added successfully "
+            f"(IDs: {first_id}-{first_id + len(new_tasks) - 1})"
+        )
+
+
 def list_tasks(status: Optional[str] = None, filename: str = FILENAME) -> None:
     """
     Lists all tasks, optionally filtered by their status, from the specified task file.
@@ -147,8 +629,8 @@ def list_tasks(status: Optional[str] = None, filename: str = FILENAME) -> None:
 
     This function attempts to read the current list of tasks from the specified file.
     If the file cannot be read due to errors, an appropriate message is displayed.
-    If a status is provided, it filters the tasks accordingly.
-    The tasks are then printed in a grid format, showing relevant details such as ID, description, status, and timestamps.
+    If a status is provided, it filters the tasks accordingly, using a cached index of task positions by status.
+    The rows are generated lazily and streamed into the table, which is printed in a grid format, showing relevant details such as ID, description, status, and timestamps.
     If no tasks are found, a message is displayed indicating this.
 
     Args:
@@ -165,26 +647,19 @@ def list_tasks(status: Optional[str] = None, filename: str = FILENAME) -> None:
         print(f"Error reading tasks: {e}")
         return
 
+    selected: Iterable[Dict] = tasks
     if status:
-        tasks = [task for task in tasks if task["status"] == status]
+        selected = map(tasks.__getitem__, _index_by_status(tasks).get(status, []))
 
-    if not tasks:
+    rows = map(_task_row, selected)
+    first = next(rows, None)
+    if first is None:
         print("No tasks found.")
         return
 
-    table = [
-        [
-            task["id"],
-            task["description"],
-            task["status"],
-            task["createdAt"],
-            task["updatedAt"],
-        ]
-        for task in tasks
-    ]
+    from tabulate import tabulate  # type: ignore
 
-    headers = ["ID", "Description", "Status", "Created At", "Updated At"]
-    print(tabulate(table, headers, tablefmt="grid"))
+    print(tabulate(chain([first], rows), _LIST_HEADERS, tablefmt="grid"))
 
 
 def update_task(task_id: int, new_description: str, filename: str = FILENAME) -> None:
@@ -212,15 +687,16 @@ def update_task(task_id: int, new_description: str, filename: str = FILENAME) ->
         print(f"Error reading tasks: {e}")
         return
 
-    for task in tasks:
-        if task["id"] == task_id:
-            task["description"] = new_description
-            task["updatedAt"] = get_current_date()
-            write_tasks(tasks, filename)
-            print(f"Task {task_id} updated successfully.")
-            return
+    i = _index_by_id(tasks).get(task_id)
+    if i is None:
+        print(f"Task with ID {task_id} not found.")
+        return
 
-    print(f"Task with ID {task_id} not found.")
+    task = tasks[i]
+    task["description"] = new_description
+    task["updatedAt"] = get_current_date()
+    write_tasks(tasks, filename)
+    print(f"Task {task_id} updated successfully.")
 
 
 def delete_task(task_id: int, filename: str = FILENAME) -> None:
@@ -230,8 +706,9 @@ def delete_task(task_id: int, filename: str = FILENAME) -> None:
 
     This function attempts to read the current list of tasks from the specified file.
     If the file cannot be read due to errors, an appropriate message is displayed.
-    The function creates a new list of tasks excluding the task with the specified ID.
-    If no tasks are removed, it indicates that the task was not found; otherwise, it saves the updated task list back to the file.
+    The function looks up the position of the first task with the specified ID and removes it from the list in place,
+    along with any later tasks sharing that ID, which older versions of the task file may contain.
+    If no such task exists, it indicates that the task was not found; otherwise, it saves the updated task list back to the file.
 
     Args:
         task_id (int): The ID of the task to be deleted.
@@ -247,12 +724,14 @@ def delete_task(task_id: int, filename: str = FILENAME) -> None:
         print(f"Error reading tasks: {e}")
         return
 
-    new_tasks = [task for task in tasks if task["id"] != task_id]
-
-    if len(new_tasks) == len(tasks):
+    i = _index_by_id(tasks).get(task_id)
+    if i is None:
         print(f"Task with ID {task_id} not found.")
         return
-    write_tasks(new_tasks, filename)
+
+    tasks.pop(i)
+    tasks[i:] = [task for task in tasks[i:] if task["id"] != task_id]
+    write_tasks(tasks, filename)
     print(f"Task {task_id} deleted successfully.")
 
 
@@ -280,28 +759,189 @@ def mark_task(task_id: int, status: str, filename: str = FILENAME) -> None:
     except (FileNotFoundError, ValueError) as e:
         print(f"Error reading tasks: {e}")
         return
-    for task in tasks:
-        if task["id"] == task_id:
-            task["status"] = status
-            task["updatedAt"] = get_current_date()
-            write_tasks(tasks, filename)
-            print(f"Task {task_id} marked as {status}.")
-            return
 
-    print(f"Task with ID {task_id} not found.")
+    i = _index_by_id(tasks).get(task_id)
+    if i is None:
+        print(f"Task with ID {task_id} not found.")
+        return
+
+    task = tasks[i]
+    task["status"] = sys.intern(status)
+    task["updatedAt"] = get_current_date()
+    write_tasks(tasks, filename)
+    print(f"Task {task_id} marked as {status}.")
+
+
+def mark_many(task_ids: List[int], status: str, filename: str = FILENAME) -> None:
+    """
+    Marks each task identified by the specified IDs with a specified status in the task file.
+    The updated timestamp of every marked task is also modified to reflect the change.
+
+    This function works like mark_task, but reads the task file once, updates all of the matching tasks in memory,
+    and writes the file back once. A message is printed for every ID that does not exist.
+
+    Args:
+        task_ids (List[int]): The IDs of the tasks to be marked.
+        status (str): The new status to assign to the tasks.
+        filename (str): The name of the file to read and write tasks. Defaults to FILENAME.
+
+    Returns:
+        None
+    """
+
+    try:
+        tasks = read_tasks(filename)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error reading tasks: {e}")
+        return
+
+    index = _index_by_id(tasks)
+    status = sys.intern(status)
+    now = get_current_date()
+    marked = []
+    for task_id in task_ids:
+        i = index.get(task_id)
+        if i is None:
+            print(f"Task with ID {task_id} not found.")
+            continue
+        tasks[i]["status"] = status
+        tasks[i]["updatedAt"] = now
+        marked.append(task_id)
+
+    if marked:
+        write_tasks(tasks, filename)
+        if len(marked) == 1:
+            print(f"Task {marked[0]} marked as {status}.")
+        else:
+            print(f"Tasks {', '.join(map(str, marked))} marked as {status}.")
+
+
+USAGE = (
+    "usage: task_cli.py [--durable] {add,add-many,list,update,delete,mark-in-progress,mark-done} [task_info ...]"
+)
+
+
+def _parse_task_id(value: str) -> Optional[int]:
+    """Converts a command-line task ID to an integer, printing an error and returning None if it is not one."""
+
+    try:
+        return int(value)
+    except ValueError:
+        print("Error: Task ID must be an integer.")
+        return None
+
+
+def _check_max_args(args: List[str], max_args: int) -> None:
+    """Prints the usage and an error to stderr and exits with status 2 if more than max_args arguments were given."""
+
+    if len(args) > max_args:
+        print(USAGE, file=sys.stderr)
+        print(f"Error: Unrecognized arguments: {' '.join(args[max_args:])}", file=sys.stderr)
+        sys.exit(2)
+
+
+def _run_add(args: List[str]) -> None:
+    """Handles the 'add' command."""
+
+    _check_max_args(args, 1)
+    if args:
+        add_task(args[0])
+    else:
+        print("Error: Missing task description for 'add' command.")
+
+
+def _run_add_many(args: List[str]) -> None:
+    """
+    Handles the 'add-many' command.
+
+    The descriptions are taken from the arguments when any are given, otherwise one per line from standard input.
+    """
+
+    if args:
+        add_many(args)
+    else:
+        add_many([line.strip() for line in sys.stdin if line.strip()])
+
 
+def _run_list(args: List[str]) -> None:
+    """Handles the 'list' command."""
 
-def main() -> None:
+    _check_max_args(args, 1)
+    list_tasks(status=args[0] if args else None)
+
+
+def _run_update(args: List[str]) -> None:
+    """Handles the 'update' command."""
+
+    _check_max_args(args, 2)
+    if len(args) < 2:
+        print("Error: Missing task ID or new description for 'update' command.")
+        return
+    task_id = _parse_task_id(args[0])
+    if task_id is not None:
+        update_task(task_id, args[1])
+
+
+def _run_delete(args: List[str]) -> None:
+    """Handles the 'delete' command."""
+
+    _check_max_args(args, 1)
+    if not args:
+        print("Error: Missing task ID for 'delete' command.")
+        return
+    task_id = _parse_task_id(args[0])
+    if task_id is not None:
+        delete_task(task_id)
+
+
+def _run_mark(command: str, status: str, args: List[str]) -> None:
+    """Handles the 'mark-in-progress' and 'mark-done' commands."""
+
+    _check_max_args(args, 1)
+    if not args:
+        print(f"Error: Missing task ID for '{command}' command.")
+        return
+    task_id = _parse_task_id(args[0])
+    if task_id is not None:
+        mark_task(task_id, status)
+
+
+def _run_mark_in_progress(args: List[str]) -> None:
+    """Handles the 'mark-in-progress' command."""
+
+    _run_mark("mark-in-progress", "in-progress", args)
+
+
+def _run_mark_done(args: List[str]) -> None:
+    """Handles the 'mark-done' command."""
+
+    _run_mark("mark-done", "done", args)
+
+
+COMMANDS: Dict[str, Callable[[List[str]], None]] = {
+    "add": _run_add,
+    "add-many": _run_add_many,
+    "list": _run_list,
+    "update": _run_update,
+    "delete": _run_delete,
+    "mark-in-progress": _run_mark_in_progress,
+    "mark-done": _run_mark_done,
+}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
     """
     Main entry point for the Task Tracker command-line interface (CLI).
     This function initializes the task file and processes user commands to manage tasks.
 
-    The function sets up an argument parser to handle various commands such as adding, listing, updating, deleting, and marking tasks.
-    It validates the input and calls the appropriate functions based on the user's command and provided task information.
-    Error messages are displayed for invalid inputs or missing information.
+    The function looks up the command in the COMMANDS dispatch table, which handles adding, listing, updating, deleting, and marking tasks.
+    Each handler validates its own arguments and calls the appropriate function based on the provided task information.
+    Error messages are displayed for invalid inputs or missing information; a missing or unknown command
+    prints the usage to stderr and exits with status 2.
+    Passing --durable before the command makes every write fsync the task file before returning.
 
     Args:
-        None
+        argv (Optional[List[str]], optional): The command-line arguments, excluding the program name. Defaults to sys.argv[1:].
 
     Returns:
         None
@@ -312,68 +952,36 @@ def main() -> None:
 
     """
 
-    initialize_task_file()
+    global _durable
 
-    parser = argparse.ArgumentParser(description="Task Tracker CLI")
-    parser.add_argument(
-        "command",
-        choices=["add", "list", "update", "delete", "mark-in-progress", "mark-done"],
-        help="Action to perform",
-    )
-    parser.add_argument(
-        "task_info",
-        help="Description of the task or task ID",
-        nargs="?",
-        default=None,
-    )
+    if argv is None:
+        argv = sys.argv[1:]
 
-    args = parser.parse_args()
+    if argv and argv[0] == "--durable":
+        _durable = True
+        argv = argv[1:]
 
-    command = args.command
-    task_info = args.task_info
-    # extra = args.extra
+    if argv and argv[0] in ("-h", "--help"):
+        print(USAGE)
+        return
 
-    if command == "add":
-        if task_info:
-            add_task(task_info)
-        else:
-            print("Error: Missing task description for 'add' command.")
-
-    elif command == "list":
-        list_tasks(status=task_info)
-
-    elif command == "update":
-        if task_info:
-            try:
-                task_id = int(task_info)
-                update_task(task_id)
-            except ValueError:
-                print("Error: Task ID must be an integer.")
-        else:
-            print("Error: Missing task ID or new description for 'update' command.")
-
-    elif command == "delete":
-        if task_info:
-            try:
-                task_id = int(task_info)
-                delete_task(task_id)
-            except ValueError:
-                print("Error: Task ID must be an integer.")
-        else:
-            print("Error: Missing task ID for 'delete' command.")
-
-    elif command in ["mark-in-progress", "mark-done"]:
-        if task_info:
-            try:
-                task_id = int(task_info)
-                status = "in-progress" if command == "mark-in-progress" else "done"
-                mark_task(task_id, status)
-            except ValueError:
-                print("Error: Task ID must be an integer.")
-        else:
-            print(f"Error: Missing task ID for '{command}' command.")
-    else:
-        print("Invalid command or arguments.")
+    if not argv:
+        print(USAGE, file=sys.stderr)
+        print("Error: Missing command.", file=sys.stderr)
+        sys.exit(2)
+
+    handler = COMMANDS.get(argv[0])
+    if handler is None:
+        print(USAGE, file=sys.stderr)
+        print(f"Error: Invalid command '{argv[0]}'.", file=sys.stderr)
+        sys.exit(2)
+
+    try:
+        initialize_task_file()
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    handler(argv[1:])
 
 
 if __name__ == "__main__":